@@ -1,12 +1,28 @@
 import os
-from app import create_app, db
+from config import get_config
+
+FLASK_CONFIG = os.getenv('FLASK_CONFIG') or 'default'
+CONFIG = get_config(FLASK_CONFIG)
+PORT = int(os.getenv('PORT', 5000))
+IS_DEV = getattr(CONFIG, 'DEBUG', False)
+
+# Green threads must be patched in before anything else opens sockets. Only the
+# dev server needs it: the flask CLI never serves websockets and gunicorn's
+# eventlet worker patches itself.
+if __name__ == '__main__' and CONFIG.SOCKETIO_ASYNC_MODE == 'eventlet':
+    import eventlet
+    from psycogreen.eventlet import patch_psycopg
+    eventlet.monkey_patch()
+    patch_psycopg()
+
+from app import create_app, db, socketio
 from app.models.user import User
 from app.models.project import Project
 from app.models.task import Task
 from app.models.comment import TaskComment
 from app.models.project_member import ProjectMember
 
-app = create_app(os.getenv('FLASK_CONFIG') or 'default')
+app = create_app(FLASK_CONFIG)
 
 
 @app.shell_context_processor
@@ -23,4 +39,7 @@ def make_shell_context():
 
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    if 'socketio' in app.extensions:
+        socketio.run(app, port=PORT, debug=IS_DEV)
+    else:
+        app.run(port=PORT, debug=IS_DEV)
\ No newline at end of file
@@ -1,21 +1,119 @@
+import os
+import sys
 from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from config import config
+from config import get_config
 
-db = SQLAlchemy()
-migrate = Migrate()
+# Extensions are created on first access (PEP 562) so importing the package
+# doesn't pay for Flask-SQLAlchemy, Alembic, JWT or SocketIO up front.
+_EXTENSIONS = ('db', 'migrate', 'jwt', 'socketio')
+_extensions = {}
 
 
-def create_app(config_name='default'):
-    app = Flask(__name__)
-    app.config.from_object(config[config_name])
+def _create_extension(name):
+    if name == 'db':
+        from flask_sqlalchemy import SQLAlchemy
+        return SQLAlchemy()
+    if name == 'migrate':
+        from flask_migrate import Migrate
+        return Migrate()
+    if name == 'jwt':
+        from flask_jwt_extended import JWTManager
+        return JWTManager()
+    if name == 'socketio':
+        from flask_socketio import SocketIO
+        return SocketIO()
+
+
+def _extension(name):
+    if name not in _extensions:
+        _extensions[name] = _create_extension(name)
+    return _extensions[name]
+
+
+def __getattr__(name):
+    if name in _EXTENSIONS:
+        return _extension(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXTENSIONS))
+
+
+def _is_flask_cli():
+    """Check whether the process was started by `flask` or `python -m flask`."""
+    argv0 = os.path.normpath(sys.argv[0]) if sys.argv else ''
+    return (os.path.basename(argv0) == 'flask'
+            or argv0.endswith(os.path.join('flask', '__main__.py')))
+
+
+def _register_models():
+    """Import models so they are registered with SQLAlchemy."""
+    import app.models  # noqa: F401
+
+
+def _init_api(app):
+    from flask_cors import CORS
+    from app.json_provider import OrjsonProvider
+
+    app.json = OrjsonProvider(app)
+    _extension('jwt').init_app(app)
+    # Only API responses need CORS headers; static and other routes skip the origin check
+    CORS(app, resources={r'/api/*': {'origins': app.config['CORS_ORIGINS']}}, send_wildcard=False)
+
+
+def _socketio_origins(origins):
+    # engine.io only treats the bare string '*' as "allow all"; a list is matched literally
+    return '*' if origins == ['*'] else origins
+
+
+def _init_socketio(app):
+    _extension('socketio').init_app(
+        app,
+        cors_allowed_origins=_socketio_origins(app.config['CORS_ORIGINS']),
+        async_mode=app.config['SOCKETIO_ASYNC_MODE'],
+        message_queue=app.config['SOCKETIO_MESSAGE_QUEUE']
+    )
+
+
+_FEATURES = {
+    'api': _init_api,
+    'websocket': _init_socketio,
+}
+
+
+def create_app(config_name='default', features=None):
+    if features is None:
+        features = os.environ.get('APP_FEATURES', ','.join(_FEATURES)).split(',')
+    features = {feature.strip() for feature in features if feature.strip()}
+    unknown = features - set(_FEATURES)
+    if unknown:
+        raise ValueError(f"Unknown app features: {', '.join(sorted(unknown))}")
+
+    # No static files or templates are served, so skip the /static URL rule
+    app = Flask(__name__, static_folder=None, template_folder=None)
+    cfg = get_config(config_name)
+    app.config.from_object(cfg)
+    cfg.resolve(app)
     
     # Initialize extensions
+    db = _extension('db')
     db.init_app(app)
-    migrate.init_app(app, db)
+    # Alembic is only needed by the `flask db` commands, not by request workers
+    if os.environ.get('ENABLE_MIGRATIONS', '0') == '1' or _is_flask_cli():
+        _extension('migrate').init_app(app, db)
     
-    # Import models to ensure they are registered with SQLAlchemy
-    from app.models import user, project, task, comment, project_member
+    _register_models()
     
-    return app
\ No newline at end of file
+    # Only initialize the subsystems this process serves
+    for feature in _FEATURES:
+        if feature in features:
+            _FEATURES[feature](app)
+    
+    return app
+
+
+# Resolve every extension at import time so deferred-import breakages surface in CI
+if os.environ.get('APP_EAGER_IMPORT') == '1':
+    for _name in _EXTENSIONS:
+        _extension(_name)
\ No newline at end of file
@@ -1 +1,4 @@
-# Database models for task management application
\ No newline at end of file
+# Database models for task management application
+from . import user, project, task, comment, project_member
+
+__all__ = ['user', 'project', 'task', 'comment', 'project_member']
\ No newline at end of file
@@ -1,29 +1,67 @@
+import functools
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+# Set LOAD_DOTENV=0 to skip the .env scan when the orchestrator provides the environment
+if os.environ.get('LOAD_DOTENV', '1') == '1':
+    from dotenv import load_dotenv
+    load_dotenv()
 
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///taskmanager.db'
+    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or SECRET_KEY
+    default_database_uri = 'sqlite:///taskmanager.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 25)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 25)),
+        'pool_timeout': 30,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+        'future': True,
+        'query_cache_size': int(os.environ.get('DB_QUERY_CACHE_SIZE', 1024)),
+    }
+    CORS_ORIGINS = [origin.strip() for origin in (os.environ.get('CORS_ORIGINS') or '*').split(',')]
+    SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE') or 'eventlet'
+    SOCKETIO_MESSAGE_QUEUE = os.environ.get('REDIS_URL')
+
+    @classmethod
+    def resolve(cls, app):
+        """Resolve environment-dependent settings once this config is selected."""
+        app.config.setdefault(
+            'SQLALCHEMY_DATABASE_URI',
+            os.environ.get('DATABASE_URL') or cls.default_database_uri
+        )
 
 
 class DevelopmentConfig(Config):
     DEBUG = True
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///taskmanager_dev.db'
+    default_database_uri = 'sqlite:///taskmanager_dev.db'
 
 
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
+    # Flask-SQLAlchemy already shares one connection for in-memory SQLite;
+    # queue pool sizing doesn't apply to it
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'future': True,
+    }
+    SOCKETIO_ASYNC_MODE = 'threading'
+    SOCKETIO_MESSAGE_QUEUE = None
 
 
 class ProductionConfig(Config):
     DEBUG = False
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
+    default_database_uri = None
+    SQLALCHEMY_ECHO = False
+    SQLALCHEMY_RECORD_QUERIES = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 50)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 50)),
+    }
 
 
 config = {
@@ -31,4 +69,10 @@ config = {
     'testing': TestingConfig,
     'production': ProductionConfig,
     'default': DevelopmentConfig
-}
\ No newline at end of file
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_config(name):
+    """Return the config class registered under the given name."""
+    return config[name]
\ No newline at end of file
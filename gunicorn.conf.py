@@ -0,0 +1,34 @@
+import os
+
+worker_class = 'eventlet'
+# More than one SocketIO worker needs sticky sessions and REDIS_URL set
+workers = int(os.getenv('WEB_CONCURRENCY', 1))
+worker_connections = 2000
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+# `app` resolves to the package rather than app.py, so load through the factory
+wsgi_app = f"app:create_app('{os.getenv('FLASK_CONFIG') or 'production'}')"
+# With several workers, import the app once in the master and fork them from it
+# so shared module state stays in copy-on-write pages. A single worker has
+# nothing to share, and loading in the worker keeps the engine and SocketIO
+# manager from being built before eventlet patches the process.
+preload_app = workers > 1
+
+
+def post_worker_init(worker):
+    """Make psycopg2 cooperative and give each worker its own connection pool.
+
+    Runs after the eventlet worker has monkey-patched itself, so the new pool
+    is built from green locks.
+    """
+    if type(worker).__module__ == 'gunicorn.workers.geventlet':
+        from psycogreen.eventlet import patch_psycopg
+
+        # psycopg2 is a C extension that monkey_patch() can't reach, so without
+        # this every query would block the worker's event loop
+        patch_psycopg()
+
+    if preload_app:
+        from app import db
+
+        with worker.wsgi.app_context():
+            db.engine.dispose()
\ No newline at end of file
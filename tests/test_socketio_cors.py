@@ -0,0 +1,24 @@
+from app import create_app
+from config import TestingConfig
+
+HANDSHAKE_URL = '/socket.io/?EIO=4&transport=polling'
+
+
+def _handshake(app, origin):
+    return app.test_client().get(HANDSHAKE_URL, headers={'Origin': origin})
+
+
+def test_handshake_accepts_any_origin_by_default(monkeypatch):
+    monkeypatch.setattr(TestingConfig, 'CORS_ORIGINS', ['*'])
+    app = create_app('testing', features=('websocket',))
+
+    assert _handshake(app, 'http://localhost').status_code == 200
+    assert _handshake(app, 'https://example.com').status_code == 200
+
+
+def test_handshake_rejects_origins_outside_cors_origins(monkeypatch):
+    monkeypatch.setattr(TestingConfig, 'CORS_ORIGINS', ['https://a.com', 'https://b.com'])
+    app = create_app('testing', features=('websocket',))
+
+    assert _handshake(app, 'https://b.com').status_code == 200
+    assert _handshake(app, 'https://evil.com').status_code == 400
\ No newline at end of file